@@ -98,6 +98,7 @@ func AntarianCreate(w http.ResponseWriter, r *http.Request) {
 		if err := json.NewEncoder(w).Encode(err); err != nil {
 			panic(err)
 		}
+		return
 	}
 
 	s := RepoCreateAntarian(antarian)